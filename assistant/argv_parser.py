@@ -5,26 +5,72 @@ Defines the CLI interface for the assistant, supporting:
 - Conversation history clearing
 - Verbose output mode
 - Silent mode (reserved for future use)
+
+The parser is built lazily on first use so that importing this module
+does not pay the argparse import cost.
 """
 
-import argparse
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_parser():
+    """Build (once) and return the ArgumentParser for the CLI."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="AI Coding Agent - Local LLM-powered coding assistant",
+        epilog="Example: ai 'list all Python files'",
+    )
+
+    parser.add_argument("prompt", nargs="*", help="User prompt for the AI agent")
+
+    parser.add_argument(
+        "-c", "--clear", action="store_true", help="Clear conversation history"
+    )
+
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Enable verbose output"
+    )
+
+    parser.add_argument(
+        "-s", "--silent", action="store_true", help="Enable silent mode"
+    )
 
-parser = argparse.ArgumentParser(
-    description="AI Coding Agent - Local LLM-powered coding assistant",
-    epilog="Example: ai 'list all Python files'",
-)
+    parser.add_argument(
+        "--plain",
+        action="store_true",
+        help="Plain output without the Rich tool-call panels",
+    )
 
-parser.add_argument("prompt", nargs="*", help="User prompt for the AI agent")
+    parser.add_argument(
+        "--chat", action="store_true", help="Enable interactive chat mode"
+    )
 
-parser.add_argument(
-    "-c", "--clear", action="store_true", help="Clear conversation history"
-)
+    parser.add_argument(
+        "--batch",
+        metavar="PATH",
+        help="Run one prompt per line from PATH as independent conversations",
+    )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=5,
+        metavar="N",
+        help="Maximum batch prompts in flight at once (default: 5)",
+    )
 
-parser.add_argument(
-    "-v", "--verbose", action="store_true", help="Enable verbose output"
-)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk LLM response cache",
+    )
 
-parser.add_argument("-s", "--silent", action="store_true", help="Enable silent mode")
+    parser.add_argument(
+        "--semantic-cache",
+        action="store_true",
+        help="Reuse answers for prompts similar to previous ones",
+    )
 
-parser.add_argument("--chat", action="store_true", help="Enable interactive chat mode")
+    return parser
@@ -4,17 +4,21 @@ This module routes tool calls from the LLM to the appropriate function
 implementations, automatically injecting the working directory for security.
 """
 
+import asyncio
+import atexit
 import os
-import json
-import time
-
-from assistant.ui import (
-    console,
-    print_function_call,
-    print_function_complete,
-    function_calls_panel,
-)
-
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+# orjson parses the (potentially multi-KB) argument payloads a few times
+# faster than stdlib json; fall back silently when it is not installed.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from assistant.functions import _cache
 from assistant.functions.get_file_content import get_file_content
 from assistant.functions.get_files_info import get_files_info
 from assistant.functions.run_python import run_python
@@ -22,6 +26,47 @@ from assistant.functions.write_file_content import write_file
 
 from assistant.config import WORKING_DIR
 
+# Maps function names from tool calls to their implementations. Built once
+# at import time so dispatch is a single dict lookup per call. Keys are
+# interned so lookups against interned incoming names reduce to pointer
+# comparisons when the LLM repeats the same tool.
+_FUNCTION_MAP = {
+    sys.intern("get_file_content"): get_file_content,
+    sys.intern("get_files_info"): get_files_info,
+    sys.intern("write_file"): write_file,
+    sys.intern("run_python"): run_python,
+}
+
+# Sniffed from argv at import time so plain runs (piping, CI) never touch
+# Rich at all: no panel rendering and no spinner thread per tool call.
+_PLAIN = "--plain" in sys.argv or "-s" in sys.argv or "--silent" in sys.argv
+
+
+def _dispatch(function_name, args):
+    """Inject the working directory and run the named tool function.
+
+    Read-only tool results are served from the in-process cache when the
+    target is unchanged on disk; mutating tools invalidate it.
+    """
+    args["working_directory"] = WORKING_DIR
+
+    function = _FUNCTION_MAP.get(function_name)
+    if function is None:
+        return {"error": f"Unknown function: {function_name}"}
+
+    cache_key, cached = _cache.lookup(function_name, args)
+    if cached is not None:
+        return cached
+
+    result = {"result": function(**args)}
+
+    if cache_key is not None:
+        _cache.store(cache_key, result)
+    else:
+        _cache.invalidate(function_name, args)
+
+    return result
+
 
 def call_function(tool_call, verbose=False):
     """Execute a function based on an OpenAI tool call.
@@ -38,48 +83,88 @@ def call_function(tool_call, verbose=False):
     The working directory is automatically injected into the function arguments
     to enforce sandboxing and prevent access outside the permitted directory.
     """
-    function_name = tool_call.function.name
-    args = json.loads(tool_call.function.arguments)
+    function_name = sys.intern(tool_call.function.name)
+    args = _json_loads(tool_call.function.arguments)
+
+    if _PLAIN:
+        if verbose:
+            print(f"> {function_name} {args}")
+        result = _dispatch(function_name, args)
+        if verbose:
+            print(
+                f"[tool cache] hits={_cache.stats['hits']} "
+                f"misses={_cache.stats['misses']}"
+            )
+        return result
+
+    # Deferred so that Rich and the UI package only load when a tool is
+    # actually dispatched, keeping cold CLI startup (e.g. `ai --help`) cheap.
+    from rich.text import Text as RichText
+
+    from assistant.ui import function_calls_panel
+
+    # Bound the display cost: long string arguments (e.g. write_file
+    # content) are elided so printing stays O(number of keys) instead of
+    # O(payload size).
+    displayable_args = {
+        key: (value[:120] + "…") if isinstance(value, str) and len(value) > 120
+        else value
+        for key, value in args.items()
+    }
 
     with function_calls_panel() as renderables:
-        from rich.text import Text as RichText
-
         # Add function call info
         call_text = RichText()
         call_text.append("▸ ", style="bold magenta")
         call_text.append(function_name, style="cyan")
         call_text.append(" ", style="")
-        call_text.append(str(args), style="dim cyan")
+        call_text.append(str(displayable_args), style="dim cyan")
         renderables.append(call_text)
 
-        # Start timing
-        start_time = time.time()
-
         # Execute function
-        args["working_directory"] = WORKING_DIR
-
-        function_map = {
-            "get_file_content": get_file_content,
-            "get_files_info": get_files_info,
-            "write_file": write_file,
-            "run_python": run_python,
-        }
-
-        if function_name not in function_map:
-            return {"error": f"Unknown function: {function_name}"}
-
-        function_result = function_map[function_name](**args)
-
-        # Ensure minimum execution time for visibility
-        elapsed = time.time() - start_time
-        if elapsed < 0.2:
-            time.sleep(0.2 - elapsed)
+        result = _dispatch(function_name, args)
 
         # Add completion message
         complete_text = RichText()
         complete_text.append("✓ ", style="bold green")
         complete_text.append(function_name, style="cyan")
         complete_text.append(" completed", style="green")
+        if verbose:
+            complete_text.append(
+                f"  (cache {_cache.stats['hits']}/"
+                f"{_cache.stats['hits'] + _cache.stats['misses']} hits)",
+                style="dim green",
+            )
         renderables.append(complete_text)
 
-    return {"result": function_result}
+    return result
+
+
+# One worker pool for the whole process. asyncio.run builds a fresh loop
+# (with a fresh default executor) per invocation — chat mode does that
+# every turn — so routing blocking work through a module-level pool keeps
+# threads warm across turns instead of respawning them. The pool itself
+# is lazy: no threads start until the first submission. It is deliberately
+# never installed as a loop's default executor, because asyncio.run shuts
+# the default executor down when its loop exits.
+_WORKER_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tool")
+atexit.register(_WORKER_POOL.shutdown, wait=False)
+
+
+def run_in_worker(func, *args, **kwargs):
+    """Schedule a blocking callable on the shared worker pool.
+
+    Returns an awaitable future tied to the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(_WORKER_POOL, partial(func, *args, **kwargs))
+
+
+async def call_function_async(tool_call, verbose=False):
+    """Execute a tool call in a worker thread without blocking the loop.
+
+    The tool implementations are synchronous (file I/O, subprocess), so
+    they run on the shared worker pool; independent tool calls from a
+    single LLM turn can then execute concurrently with asyncio.gather.
+    """
+    return await run_in_worker(call_function, tool_call, verbose=verbose)
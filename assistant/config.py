@@ -7,6 +7,9 @@ Defines:
 - System prompt that defines the AI's behavior and capabilities
 """
 
+# Model identifier sent to the OpenAI-compatible endpoint
+MODEL = "qwen/qwen3-8b"
+
 # Maximum number of characters to read from a file before truncating
 MAX_CHARS = 1000000
 
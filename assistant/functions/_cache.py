@@ -0,0 +1,113 @@
+"""In-process result cache for the deterministic read-only tools.
+
+Agent loops routinely re-read the same files and re-list the same
+directories across iterations. Results for get_file_content and
+get_files_info are cached keyed on the resolved target path plus its
+stat signature (mtime + size), so a repeat call against unchanged data
+costs a dict lookup instead of the full read and string formatting.
+
+Mutating tools keep the cache honest: write_file drops entries for the
+written file and its parent directory listing, and run_python (which can
+touch anything) clears the cache entirely. The mtime component of the
+key also self-invalidates entries whenever a file changes on disk.
+"""
+
+import os
+import threading
+import time
+
+from assistant.functions._sandbox import absolute_target, absolute_working_directory
+
+# Per-tool freshness policy. File reads are fully covered by the stat
+# signature in the key, so they never expire on their own. Directory
+# listings get a short TTL on top: rewriting an existing file changes its
+# size but not the parent directory's mtime, so a listing can go stale
+# without its key changing. The mutating tools are never cached.
+TOOL_POLICY = {
+    "get_file_content": {"cache": True, "ttl": None},
+    "get_files_info": {"cache": True, "ttl": 5.0},
+    "write_file": {"cache": False},
+    "run_python": {"cache": False},
+}
+
+# Entries are kept in insertion order and refreshed on hit, giving a
+# simple LRU bound so long sessions cannot grow the cache without limit.
+_MAX_ENTRIES = 256
+
+_results = {}
+
+# Tool calls execute on concurrent worker threads; the del/reinsert
+# recency dance in lookup and store's LRU eviction are not atomic, so
+# all access to _results (and the counters) goes through this lock.
+_lock = threading.Lock()
+
+# Hit/miss counters for the cacheable tools, surfaced in verbose output.
+stats = {"hits": 0, "misses": 0}
+
+
+def _target_path(args):
+    """Resolve the absolute path a tool call operates on."""
+    relative = args.get("file_path") or args.get("directory", ".")
+    return absolute_target(
+        absolute_working_directory(args["working_directory"]), relative
+    )
+
+
+def lookup(function_name, args):
+    """Return a (key, cached_result) pair for a tool call.
+
+    key is None when the call is not cacheable (mutating tool, or the
+    target cannot be stat'ed); cached_result is None on a cache miss or
+    when the entry has aged past its tool's TTL.
+    """
+    policy = TOOL_POLICY.get(function_name)
+    if policy is None or not policy["cache"]:
+        return None, None
+
+    target = _target_path(args)
+    try:
+        stat_result = os.stat(target)
+    except OSError:
+        return None, None
+
+    key = (function_name, target, stat_result.st_mtime_ns, stat_result.st_size)
+
+    with _lock:
+        entry = _results.get(key)
+        ttl = policy["ttl"]
+        if entry is not None and ttl is not None:
+            if time.monotonic() - entry[1] > ttl:
+                del _results[key]
+                entry = None
+
+        if entry is None:
+            stats["misses"] += 1
+            return key, None
+
+        stats["hits"] += 1
+        # Refresh recency by reinserting at the end of the dict order.
+        del _results[key]
+        _results[key] = entry
+        return key, entry[0]
+
+
+def store(key, result):
+    """Remember the result of a cacheable tool call, evicting the LRU entry."""
+    with _lock:
+        if len(_results) >= _MAX_ENTRIES:
+            del _results[next(iter(_results))]
+        _results[key] = (result, time.monotonic())
+
+
+def invalidate(function_name, args):
+    """Drop entries made stale by a mutating tool call."""
+    if function_name == "write_file":
+        target = _target_path(args)
+        stale_paths = (target, os.path.dirname(target))
+        with _lock:
+            for key in [k for k in _results if k[1] in stale_paths]:
+                del _results[key]
+    elif function_name == "run_python":
+        # Executed scripts may modify arbitrary files; start fresh.
+        with _lock:
+            _results.clear()
@@ -0,0 +1,50 @@
+"""Shared path helpers for the sandboxed tool functions.
+
+Every tool function restricts file access to the configured working
+directory. The helpers here centralize the path normalization those
+checks rely on so the per-call cost stays minimal.
+"""
+
+import os
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8)
+def absolute_working_directory(working_directory):
+    """Return the absolute path of the working directory, cached.
+
+    The working directory is injected by the dispatcher and never changes
+    within a process, so the abspath result (which involves a getcwd
+    syscall and string normalization) is computed at most once per
+    distinct value.
+    """
+    return os.path.abspath(working_directory)
+
+
+def absolute_target(abs_working_directory, relative_path):
+    """Resolve a tool path against the already-absolute working directory.
+
+    os.path.abspath re-runs getcwd and normalizes from scratch on every
+    call; the root here is already absolute, so a join plus normpath
+    produces the same result without the getcwd syscall. An absolute
+    relative_path wins the join, matching abspath semantics, and is then
+    rejected by the containment check as before.
+    """
+    return os.path.normpath(os.path.join(abs_working_directory, relative_path))
+
+
+@lru_cache(maxsize=8)
+def _root_prefix(root_abs):
+    return root_abs + os.sep
+
+
+def is_within_working_directory(target_abs, root_abs):
+    """Check whether target_abs is the working directory or inside it.
+
+    A plain startswith() comparison would wrongly accept sibling paths
+    that merely share the prefix (e.g. "/tmp/workfoo" against
+    "/tmp/work"), so the check requires either an exact match or the
+    root followed by a path separator. The separator-suffixed root is
+    cached since the root never changes within a process.
+    """
+    return target_abs == root_abs or target_abs.startswith(_root_prefix(root_abs))
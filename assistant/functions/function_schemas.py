@@ -86,3 +86,13 @@ schema_run_python = {
         },
     },
 }
+
+# The complete tool set offered to the LLM. Built once at import time as a
+# tuple so every request shares the same schema objects and nothing can
+# accidentally grow or reorder the list between calls.
+TOOL_SCHEMAS = (
+    schema_get_files_info,
+    schema_get_file_content,
+    schema_write_file,
+    schema_run_python,
+)
@@ -7,6 +7,11 @@ truncation for large files to prevent memory issues.
 import os
 
 from assistant.config import MAX_CHARS
+from assistant.functions._sandbox import (
+    absolute_target,
+    absolute_working_directory,
+    is_within_working_directory,
+)
 
 
 def get_file_content(working_directory, file_path):
@@ -25,25 +30,31 @@ def get_file_content(working_directory, file_path):
     Files larger than MAX_CHARS are truncated with a notice appended.
     """
     try:
-        abs_working_directory = os.path.abspath(working_directory)
-        abs_target_file = os.path.abspath(os.path.join(working_directory, file_path))
+        abs_working_directory = absolute_working_directory(working_directory)
+        abs_target_file = absolute_target(abs_working_directory, file_path)
 
-        if not abs_target_file.startswith(abs_working_directory):
+        if not is_within_working_directory(abs_target_file, abs_working_directory):
             return f'Error: Cannot read "{file_path}" as it is outside the permitted working directory'
 
         if not os.path.isfile(abs_target_file):
             return f'Error: File not found or is not a regular file: "{file_path}"'
 
-        # Read and possibly truncate
-        if os.path.getsize(abs_target_file) > MAX_CHARS:
-            with open(abs_target_file, "r") as f:
-                file_content = f.read(MAX_CHARS)
-            file_content += (
+        # Read one character past the limit in a single pass; a longer
+        # result means the file needs truncating. This avoids the extra
+        # getsize() stat the previous size gate required. errors="replace"
+        # keeps binary or mis-encoded files from raising UnicodeDecodeError
+        # — the LLM gets replacement characters instead of an error string.
+        with open(abs_target_file, "r", errors="replace") as f:
+            file_content = f.read(MAX_CHARS + 1)
+
+        if len(file_content) > MAX_CHARS:
+            # Single f-string so CPython builds the result in one pass
+            # instead of allocating a second MAX_CHARS-sized intermediate
+            # for the concatenation.
+            return (
+                f'{file_content[:MAX_CHARS]}'
                 f'[...File "{file_path}" truncated at {MAX_CHARS} characters]'
             )
-        else:
-            with open(abs_target_file, "r") as f:
-                file_content = f.read()
 
         return file_content
 
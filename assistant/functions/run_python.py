@@ -6,6 +6,17 @@ timeout, capturing both stdout and stderr.
 
 import os
 import subprocess
+import sys
+
+from assistant.functions._sandbox import (
+    absolute_target,
+    absolute_working_directory,
+    is_within_working_directory,
+)
+
+# Resolved once at import so each exec starts from a concrete interpreter
+# path instead of re-deriving it per call.
+_PYTHON = sys.executable
 
 
 def run_python(working_directory, file_path, args=[]):
@@ -31,10 +42,10 @@ def run_python(working_directory, file_path, args=[]):
     The script runs with the working directory as its current directory.
     """
     try:
-        abs_working_directory = os.path.abspath(working_directory)
-        abs_target_file = os.path.abspath(os.path.join(working_directory, file_path))
+        abs_working_directory = absolute_working_directory(working_directory)
+        abs_target_file = absolute_target(abs_working_directory, file_path)
 
-        if not abs_target_file.startswith(abs_working_directory):
+        if not is_within_working_directory(abs_target_file, abs_working_directory):
             return f'Error: Cannot execute "{file_path}" as it is outside the permitted working directory'
 
         if not os.path.exists(abs_target_file):
@@ -44,7 +55,7 @@ def run_python(working_directory, file_path, args=[]):
             return f'Error: "{file_path}" is not a Python file.'
 
         completed_process = subprocess.run(
-            ["python", file_path] + args,
+            [_PYTHON, file_path] + args,
             timeout=30,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -52,19 +63,19 @@ def run_python(working_directory, file_path, args=[]):
             cwd=working_directory,
         )
 
-        if not completed_process.stdout and not completed_process.stderr:
-            return "No output produced."
-
-        result = (
-            f"STDOUT: {completed_process.stdout}\n"
-            f"STDERR: {completed_process.stderr}\n"
-            f"{
-                f'Process exited with code {completed_process.returncode}'
-                if completed_process.returncode != 0 else ''
-            }"
-        )
-
-        return result
+        # Assemble only the sections that have content, with one final
+        # join. The old format always materialized both streams into the
+        # result — for a script dumping megabytes on one stream that
+        # meant an extra full-size copy plus an empty-section header.
+        parts = []
+        if completed_process.stdout:
+            parts.append(f"STDOUT: {completed_process.stdout}")
+        if completed_process.stderr:
+            parts.append(f"STDERR: {completed_process.stderr}")
+        if completed_process.returncode != 0:
+            parts.append(f"Process exited with code {completed_process.returncode}")
+
+        return "\n".join(parts) if parts else "No output produced."
 
     except Exception as e:
         return f"Error: executing Python file: {e}"
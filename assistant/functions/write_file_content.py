@@ -6,6 +6,12 @@ automatically creating parent directories as needed.
 
 import os
 
+from assistant.functions._sandbox import (
+    absolute_target,
+    absolute_working_directory,
+    is_within_working_directory,
+)
+
 
 def write_file(working_directory, file_path, content):
     """Write content to a file within the working directory.
@@ -25,16 +31,17 @@ def write_file(working_directory, file_path, content):
     """
 
     try:
-        abs_working_directory = os.path.abspath(working_directory)
-        abs_target_file = os.path.abspath(os.path.join(working_directory, file_path))
+        abs_working_directory = absolute_working_directory(working_directory)
+        abs_target_file = absolute_target(abs_working_directory, file_path)
 
-        if not abs_target_file.startswith(abs_working_directory):
+        if not is_within_working_directory(abs_target_file, abs_working_directory):
             return f'Error: Cannot write to "{file_path}" as it is outside the permitted working directory'
 
-        if not os.path.exists(abs_target_file):
-            os.makedirs(os.path.dirname(abs_target_file), exist_ok=True)
+        # makedirs with exist_ok=True is already idempotent, so there is no
+        # need for the extra exists() stat that previously guarded it.
+        os.makedirs(os.path.dirname(abs_target_file), exist_ok=True)
 
-        with open(abs_target_file, "w") as f:
+        with open(abs_target_file, "w", encoding="utf-8") as f:
             f.write(content)
 
         return (
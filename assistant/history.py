@@ -0,0 +1,105 @@
+"""Sliding-window trimming for the conversation history.
+
+The agent re-sends the entire message history on every LLM call, so
+input tokens per turn grow linearly over long sessions. trim_history
+produces a bounded view of the history for the request: the system
+prompt, a short summary of whatever had to be dropped, and the most
+recent messages that fit the token budget.
+
+Token counts are estimated at roughly four characters per token, which
+is accurate enough for a trimming threshold and avoids a tokenizer
+dependency. The caller's message list is never mutated — the full
+transcript still accumulates (and is persisted) untouched; only the
+request payload is windowed.
+"""
+
+import json
+
+# Estimated token budget for the request history. Qwen3's context is far
+# larger, but keeping requests lean is the point: latency and cost scale
+# with input size.
+MAX_HISTORY_TOKENS = 4000
+
+_CHARS_PER_TOKEN = 4
+
+
+def _estimate_tokens(message):
+    """Roughly estimate the token cost of one message."""
+    return len(json.dumps(message, default=str)) // _CHARS_PER_TOKEN
+
+
+def _summarize_dropped(dropped):
+    """Condense dropped messages into a single system note.
+
+    User prompts carry the intent of the trimmed turns, so their openings
+    are quoted; tool traffic is only counted.
+    """
+    prompts = [
+        m["content"][:80]
+        for m in dropped
+        if m.get("role") == "user" and isinstance(m.get("content"), str)
+    ]
+    summary = (
+        f"Prior context summary: {len(dropped)} earlier messages were "
+        "trimmed to fit the context window."
+    )
+    if prompts:
+        listed = "; ".join(prompts[-5:])
+        summary += f" Earlier user requests included: {listed}"
+    return {"role": "system", "content": summary}
+
+
+def trim_history(messages, max_tokens=MAX_HISTORY_TOKENS):
+    """Return a bounded copy of messages for an LLM request.
+
+    Keeps the leading system prompt plus the longest recent suffix that
+    fits max_tokens, preceded by a summary of the dropped middle. The
+    suffix never starts on a tool message, so tool results are not
+    orphaned from the assistant turn that requested them, and it always
+    reaches back at least to the latest user message: a single oversized
+    message (one large tool result is enough) must shrink the window,
+    never evict the question currently being answered. Histories already
+    within budget are returned as-is.
+    """
+    if sum(_estimate_tokens(m) for m in messages) <= max_tokens:
+        return messages
+
+    head = []
+    body = messages
+    if messages and messages[0].get("role") == "system":
+        head = [messages[0]]
+        body = messages[1:]
+
+    budget = max_tokens - sum(_estimate_tokens(m) for m in head)
+
+    # Walk backwards accumulating the most recent messages that fit.
+    start = len(body)
+    used = 0
+    while start > 0:
+        cost = _estimate_tokens(body[start - 1])
+        if used + cost > budget:
+            break
+        used += cost
+        start -= 1
+
+    # Never open the window on orphaned tool results.
+    while start < len(body) and body[start].get("role") == "tool":
+        start += 1
+
+    # Floor: the in-progress turn (latest user message onward) is kept
+    # even when it alone exceeds the budget.
+    for floor in range(len(body) - 1, -1, -1):
+        if body[floor].get("role") == "user":
+            start = min(start, floor)
+            break
+    else:
+        # No user message to anchor on; trimming everything would send a
+        # contentless request, so leave the history untouched instead.
+        if start >= len(body):
+            return messages
+
+    dropped = body[:start]
+    if not dropped:
+        return messages
+
+    return head + [_summarize_dropped(dropped)] + body[start:]
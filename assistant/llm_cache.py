@@ -0,0 +1,85 @@
+"""Disk-backed cache for LLM responses.
+
+Re-running the assistant with an identical request (same model, message
+history, and tool schemas) pays full network and model latency for an
+answer that was already produced — a common situation during development
+iteration and scripted runs. Responses are stored on disk keyed by a
+SHA-256 hash of the canonicalized request payload and served from the
+cache without touching the network on subsequent runs.
+
+The assistant never sets a sampling temperature, so cached responses are
+only as deterministic as the backing server; the --no-cache flag
+bypasses the cache entirely when fresh generations are wanted.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+
+
+def user_cache_dir():
+    """Return the per-user cache root for the assistant.
+
+    Caches used to live under assistant/data/ relative to the current
+    directory, so running the CLI from anywhere else silently started a
+    cold cache (and scattered cache dirs around the filesystem). The
+    XDG cache home gives every invocation the same warm cache.
+    """
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(root, "cli-assistant")
+
+
+CACHE_DIR = os.path.join(user_cache_dir(), "llm_cache")
+
+# The tool schemas are frozen at import time, so their (sizeable) JSON
+# canonicalization is computed once per schema tuple instead of on every
+# cache-key derivation in the agent loop. Keyed by identity because the
+# schema dicts themselves are not hashable.
+_tools_payloads = {}
+
+
+def _tools_payload(tools):
+    """Return (and memoize) the canonical JSON for a tool-schema tuple."""
+    payload = _tools_payloads.get(id(tools))
+    if payload is None:
+        payload = json.dumps(tools, sort_keys=True, default=str)
+        _tools_payloads[id(tools)] = payload
+    return payload
+
+
+def cache_key(model, messages, tools):
+    """Build the cache key for a chat-completion request.
+
+    The payload is canonicalized with sorted keys so dict ordering never
+    produces spurious misses.
+    """
+    payload = json.dumps(
+        {"model": model, "messages": messages},
+        sort_keys=True,
+        default=str,
+    )
+    payload += _tools_payload(tools)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _entry_path(key):
+    return os.path.join(CACHE_DIR, f"{key}.pkl")
+
+
+def load(key):
+    """Return the cached response for a key, or None when absent/unreadable."""
+    try:
+        with open(_entry_path(key), "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        return None
+
+
+def save(key, response):
+    """Persist a response under its request key."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(_entry_path(key), "wb") as f:
+        pickle.dump(response, f)
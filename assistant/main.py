@@ -13,64 +13,117 @@ The assistant can:
 All operations are sandboxed to a specified working directory for security.
 """
 
+import asyncio
 import os
 import sys
 import json
 import time
 
-from dotenv import load_dotenv  # type: ignore
-from openai import OpenAI
-from rich import box
-from rich.align import Align
-from rich.panel import Panel
-from rich.text import Text
-
-from assistant.ui import (
-    print_response,
-    print_error,
-    print_success,
-    print_warning,
-    print_banner,
-    processing_panel,
-    matrix_container,
-    console,
-    get_user_input_in_matrix,
-)
-
-from assistant.functions.function_schemas import (
-    schema_get_files_info,
-    schema_get_file_content,
-    schema_write_file,
-    schema_run_python,
-)
-
-from assistant.argv_parser import parser
-from assistant.call_function import call_function
-from assistant.config import SYSTEM_PROMPT
-
-load_dotenv()
-
-# --- Neuro client setup (Qwen3 LLM) ---
-api_key = os.environ.get("NEURO_API_KEY")
-base_url = os.environ.get("NEURO_BASE_URL")
-
-client = OpenAI(api_key=api_key, base_url=base_url)
-
-available_functions = [
-    schema_get_files_info,
-    schema_get_file_content,
-    schema_write_file,
-    schema_run_python,
-]
-
-
-def generate_response(client, messages, is_verbose=False):
+# orjson serializes the (growing) conversation history an order of
+# magnitude faster than stdlib json; fall back when it is unavailable.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from contextlib import nullcontext
+from functools import lru_cache
+
+# Lazy package: submodules (and Rich) load on first attribute access.
+from assistant import ui
+from assistant.functions.function_schemas import TOOL_SCHEMAS
+
+from assistant.argv_parser import get_parser
+from assistant.call_function import call_function_async, run_in_worker
+from assistant.config import MODEL, SYSTEM_PROMPT
+from assistant.history import trim_history
+from assistant import llm_cache
+from assistant import semantic_cache
+
+available_functions = TOOL_SCHEMAS
+
+# Tools safe to deduplicate within a single turn: models sometimes emit
+# the same read twice in one response, and re-running it buys nothing.
+# The mutating tools (write_file, run_python) always execute.
+_DEDUP_TOOLS = frozenset({"get_file_content", "get_files_info"})
+
+
+class _StreamedToolCall:
+    """Just enough of a tool call to dispatch before the stream ends.
+
+    The arguments-done stream event carries the call's name and complete
+    argument JSON but not the assembled SDK object, which only exists
+    once the stream finishes. This shim lets execution start from the
+    event; message bookkeeping still uses the SDK tool calls (and their
+    ids) from the final completion.
+    """
+
+    __slots__ = ("function",)
+
+    class _Function:
+        __slots__ = ("name", "arguments")
+
+        def __init__(self, name, arguments):
+            self.name = name
+            self.arguments = arguments
+
+    def __init__(self, name, arguments):
+        self.function = self._Function(name, arguments)
+
+
+def _dumps_str(obj):
+    """Serialize to a JSON string, preferring orjson.
+
+    Tool results can embed whole file contents, where orjson is several
+    times faster than stdlib json.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+@lru_cache(maxsize=1)
+def _get_client():
+    """Build (once) the AsyncOpenAI client for the local Qwen3 LLM.
+
+    Deferred so command paths that never talk to the LLM (--clear, --help,
+    missing prompt) do not pay the openai/httpx import cost at startup.
+    """
+    import httpx
+    from dotenv import load_dotenv  # type: ignore
+    from openai import AsyncOpenAI
+
+    load_dotenv()
+
+    # One keep-alive connection pool for the whole session: the agent loop
+    # makes up to 20 sequential API calls per prompt, and reusing the
+    # transport avoids a fresh TCP/TLS handshake for each of them.
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=4),
+        timeout=60.0,
+    )
+
+    return AsyncOpenAI(
+        api_key=os.environ.get("NEURO_API_KEY"),
+        base_url=os.environ.get("NEURO_BASE_URL"),
+        http_client=http_client,
+    )
+
+
+async def generate_response(
+    client, messages, is_verbose=False, use_cache=True, show_stream=True
+):
     """Generate a response from the AI and execute any tool calls.
 
     Args:
         client: OpenAI client instance configured for the local LLM.
         messages: List of message dictionaries in OpenAI format.
         is_verbose: If True, print detailed function call information.
+        use_cache: If True, serve identical requests from the on-disk
+            response cache instead of calling the API.
+        show_stream: If True, render the response as it streams in.
+            Disabled for concurrent batch runs, where multiple live
+            panels would collide.
 
     Returns:
         The text content of the final response if no tool calls were made,
@@ -82,44 +135,107 @@ def generate_response(client, messages, is_verbose=False):
     3. Executes any requested tool calls and appends results to messages
     4. Returns control for the next iteration or final output
     """
-    # Show spinner while waiting for LLM response
-    with processing_panel("AI is thinking"):
-        response = client.chat.completions.create(
-            model="qwen/qwen3-8b",
-            messages=messages,
-            tools=available_functions,
+    # Bound the request payload: long sessions send a windowed view of the
+    # history while the full transcript keeps accumulating in messages.
+    request_messages = trim_history(messages)
+
+    request_key = None
+    response = None
+    tool_tasks = {}
+    dedup_tasks = {}
+
+    def _start_tool(index, name, arguments, tool_call):
+        """Schedule a tool call, sharing one task across exact duplicates."""
+        key = (name, arguments) if name in _DEDUP_TOOLS else None
+        task = dedup_tasks.get(key) if key is not None else None
+        if task is None:
+            task = asyncio.ensure_future(
+                call_function_async(tool_call, verbose=is_verbose)
+            )
+            if key is not None:
+                dedup_tasks[key] = task
+        tool_tasks[index] = task
+        return task
+
+    if use_cache:
+        request_key = llm_cache.cache_key(MODEL, request_messages, available_functions)
+        response = llm_cache.load(request_key)
+
+    if response is None:
+        # Stream the completion so tokens render as they arrive instead of
+        # hiding the whole round trip behind a spinner. The stream helper
+        # assembles content and tool-call deltas back into a full
+        # completion object, so everything downstream (including the
+        # response cache) is unchanged.
+        stream_panel = (
+            ui.streaming_panel("AI is thinking")
+            if show_stream
+            else nullcontext(lambda snapshot: None)
         )
+        with stream_panel as update_stream:
+            async with client.chat.completions.stream(
+                model=MODEL,
+                messages=request_messages,
+                tools=available_functions,
+            ) as stream:
+                async for event in stream:
+                    if event.type == "content.delta":
+                        update_stream(event.snapshot)
+                    elif event.type == "tool_calls.function.arguments.done":
+                        # Pipeline: a tool call's arguments are complete
+                        # as soon as this event fires, so its execution
+                        # starts here and overlaps the rest of the
+                        # model's generation instead of waiting for the
+                        # stream to finish.
+                        _start_tool(
+                            event.index,
+                            event.name,
+                            event.arguments,
+                            _StreamedToolCall(event.name, event.arguments),
+                        )
+                response = await stream.get_final_completion()
+
+        if request_key is not None:
+            llm_cache.save(request_key, response)
 
     response_message = response.choices[0].message
 
-    msg_dict = {"role": "assistant"}
-
-    if response_message.content is not None:
-        msg_dict["content"] = response_message.content
-
-    if response_message.tool_calls:
-        msg_dict["tool_calls"] = [
-            {
-                "id": tc.id,
-                "type": tc.type,
-                "function": {
-                    "name": tc.function.name,
-                    "arguments": tc.function.arguments,
-                },
-            }
-            for tc in response_message.tool_calls
-        ]
-
-    messages.append(msg_dict)
+    # The SDK message is already a pydantic model; one model_dump beats
+    # hand-copying every tool-call field into fresh dicts. The stream
+    # helper returns a ParsedChatCompletionMessage, so the SDK-internal
+    # parsed/parsed_arguments fields are excluded: they duplicate the
+    # raw arguments string and the API rejects unknown fields when the
+    # message is sent back.
+    messages.append(
+        response_message.model_dump(
+            exclude_none=True,
+            exclude={
+                "parsed": True,
+                "tool_calls": {"__all__": {"function": {"parsed_arguments"}}},
+            },
+        )
+    )
 
     # If there are no tool calls, return the text response
     if not response_message.tool_calls:
         return response_message.content
 
-    # Process tool calls
-    for tool_call in response_message.tool_calls:
-        function_result = call_function(tool_call, verbose=is_verbose)
+    # Process tool calls. Calls already started mid-stream are awaited;
+    # any remainder (always the case when the response came from the
+    # cache) is dispatched now. Independent calls from one LLM turn run
+    # concurrently; results are appended in the original call order so
+    # the conversation stays deterministic.
+    results = await asyncio.gather(
+        *(
+            tool_tasks.get(index)
+            or _start_tool(
+                index, tool_call.function.name, tool_call.function.arguments, tool_call
+            )
+            for index, tool_call in enumerate(response_message.tool_calls)
+        )
+    )
 
+    for tool_call, function_result in zip(response_message.tool_calls, results):
         if is_verbose:
             print(f"-> {function_result}")
 
@@ -129,78 +245,288 @@ def generate_response(client, messages, is_verbose=False):
                 "role": "tool",
                 "tool_call_id": tool_call.id,
                 "name": tool_call.function.name,
-                "content": json.dumps(function_result),
+                "content": _dumps_str(function_result),
             }
         )
 
     return None
 
 
-def save_conversation(messages, filename="assistant/data/conversation_history.json"):
-    """Save conversation history to a JSON file.
+async def _agent_loop(client, messages, is_verbose=False, use_cache=True):
+    """Drive generate_response until the LLM produces a final answer.
+
+    Each turn's new messages are persisted in a worker thread while the
+    next LLM call is in flight, so history I/O never sits on the critical
+    path. At most one save runs at a time; the last one is awaited before
+    returning so nothing is lost on exit.
+
+    Returns the final response text, or None if the iteration limit was
+    reached without one.
+    """
+    final_text = None
+    save_task = None
+    last_turn_signature = None
+
+    for _ in range(20):
+        prev_len = len(messages)
+        final_text = await generate_response(client, messages, is_verbose, use_cache)
+
+        if save_task is not None:
+            await save_task
+        save_task = run_in_worker(save_conversation, messages)
+
+        if final_text:
+            ui.print_response(final_text)
+            break
+
+        # Degenerate turn: no final text and no tool results appended
+        # beyond the assistant message itself. Iterating again would just
+        # replay the same request up to 19 more times.
+        if len(messages) <= prev_len + 1:
+            ui.print_error("LLM made no progress; stopping.")
+            break
+
+        # Convergence check: a turn whose tool calls are byte-identical
+        # to the previous turn's means the model is looping (re-reading
+        # the same file, re-listing the same directory) rather than
+        # advancing; burning the remaining iterations on replays wastes
+        # API calls without changing the outcome.
+        turn_signature = tuple(
+            (call["function"]["name"], call["function"]["arguments"])
+            for call in messages[prev_len].get("tool_calls") or ()
+        )
+        if turn_signature and turn_signature == last_turn_signature:
+            ui.print_error("LLM is repeating the same tool calls; stopping.")
+            break
+        last_turn_signature = turn_signature
+
+    if save_task is not None:
+        await save_task
+    return final_text
+
+
+async def _run_batch(
+    client, prompts, concurrency, is_verbose=False, use_cache=True, use_semantic=False
+):
+    """Run independent prompts concurrently through a bounded pool.
+
+    Each prompt is its own fresh conversation (system prompt only, no
+    shared history, no persistence); a semaphore caps how many are in
+    flight, so N prompts finish in roughly the latency of the slowest
+    rather than the sum. Streaming display is disabled — concurrent live
+    panels would fight over the terminal.
+
+    Returns the final response texts in prompt order (None where a
+    prompt hit the iteration limit).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(prompt):
+        if use_semantic:
+            cached_text = semantic_cache.lookup(prompt)
+            if cached_text is not None:
+                return cached_text
+
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ]
+
+        async with semaphore:
+            for _ in range(20):
+                final_text = await generate_response(
+                    client, messages, is_verbose, use_cache, show_stream=False
+                )
+                if final_text:
+                    if use_semantic:
+                        semantic_cache.store(prompt, final_text)
+                    return final_text
+        return None
+
+    return await asyncio.gather(*(run_one(prompt) for prompt in prompts))
+
+
+HISTORY_FILE = "assistant/data/conversation_history.jsonl"
+
+# Pre-JSONL installs kept the history as one JSON list; it is migrated
+# to the JSONL log on first load so old conversations survive upgrades.
+_LEGACY_HISTORY_FILE = "assistant/data/conversation_history.json"
+
+# Number of messages already persisted, so each save appends only the
+# new tail instead of rewriting the entire history.
+_saved_count = 0
+
+# The data directory only needs to be created once per process; the flag
+# saves a stat syscall on every subsequent save in multi-turn sessions.
+_DATA_DIR_READY = False
+
+
+# Reusable staging buffer for history writes. Saves are serialized (the
+# agent loop keeps at most one in flight), so one buffer can be cleared
+# and refilled per save instead of allocating fresh bytes every turn.
+_SAVE_BUF = bytearray()
+
+
+def _dumps_line(message):
+    """Serialize one message to a JSONL line (bytes)."""
+    if orjson is not None:
+        return orjson.dumps(message, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(message).encode("utf-8") + b"\n"
+
+
+def save_conversation(messages, filename=HISTORY_FILE):
+    """Append new conversation messages to the JSONL history log.
 
     Args:
         messages: List of message dictionaries in OpenAI format.
-        filename: Path to the JSON file where history will be saved.
+        filename: Path to the JSONL file where history is kept.
+
+    The log is append-only: only messages added since the last save are
+    written, so I/O per turn is proportional to the new messages rather
+    than the entire accumulated history.
+    """
+    global _saved_count, _DATA_DIR_READY
+
+    new_messages = messages[_saved_count:]
+    if not new_messages:
+        return
+
+    if not _DATA_DIR_READY:
+        # exist_ok avoids the racy exists-then-mkdir dance.
+        os.makedirs("assistant/data", exist_ok=True)
+        _DATA_DIR_READY = True
+
+    _SAVE_BUF.clear()
+    for message in new_messages:
+        _SAVE_BUF.extend(_dumps_line(message))
+
+    with open(filename, "ab") as f:
+        f.write(_SAVE_BUF)
+
+    # Advance by what was actually written, not len(messages): the event
+    # loop may append to the live list while this runs on the worker
+    # pool, and re-reading its length here would mark those messages as
+    # saved without ever writing them.
+    _saved_count += len(new_messages)
+
+
+def _migrate_legacy_history(filename):
+    """One-time upgrade of the pre-JSONL history file to the JSONL log.
+
+    Args:
+        filename: Path of the JSONL file to migrate into.
 
-    The conversation history allows the assistant to maintain context
-    across multiple invocations, enabling multi-turn conversations.
+    Returns:
+        The migrated message list, or empty list when the legacy file
+        cannot be parsed (it is rotated aside rather than deleted).
     """
-    if not os.path.exists("assistant/data"):
-        os.makedirs("assistant/data")
+    global _saved_count
+
+    loads = orjson.loads if orjson is not None else json.loads
+    try:
+        with open(_LEGACY_HISTORY_FILE, "rb") as f:
+            history = loads(f.read())
+    except (OSError, ValueError):
+        os.replace(_LEGACY_HISTORY_FILE, _LEGACY_HISTORY_FILE + ".corrupt")
+        ui.print_warning(
+            "Old conversation history could not be read; moved it to "
+            f"{_LEGACY_HISTORY_FILE}.corrupt and starting fresh."
+        )
+        return []
 
-    # All messages are already in dict format, just save them
-    with open(filename, "w") as f:
-        json.dump(messages, f, indent=2)
+    with open(filename, "wb") as f:
+        for message in history:
+            f.write(_dumps_line(message))
+    os.remove(_LEGACY_HISTORY_FILE)
+
+    _saved_count = len(history)
+    return history
 
 
-def get_saved_conversation(filename="assistant/data/conversation_history.json"):
-    """Load conversation history from a JSON file.
+def get_saved_conversation(filename=HISTORY_FILE):
+    """Load conversation history from the JSONL log.
 
     Args:
-        filename: Path to the JSON file containing conversation history.
+        filename: Path to the JSONL file containing conversation history.
 
     Returns:
         List of message dictionaries in OpenAI format, or empty list
         if no history exists or the file cannot be parsed.
     """
+    global _saved_count
+
     if not os.path.exists(filename):
+        if os.path.exists(_LEGACY_HISTORY_FILE):
+            return _migrate_legacy_history(filename)
         return []
 
-    with open(filename, "r") as f:
-        try:
-            history = json.load(f)
-        except json.JSONDecodeError:
-            return []
+    loads = orjson.loads if orjson is not None else json.loads
+    history = []
+
+    with open(filename, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            # Both json and orjson decode errors are ValueErrors
+            try:
+                history.append(loads(line))
+            except ValueError:
+                # A torn tail (crash mid-append) must not be appended
+                # after forever. Rotate the file aside and keep the
+                # cleanly parsed prefix; _saved_count stays 0, so the
+                # next save rewrites that prefix to a fresh log.
+                os.replace(filename, filename + ".corrupt")
+                ui.print_warning(
+                    "Conversation history was partially corrupted; "
+                    f"moved the damaged log to {filename}.corrupt."
+                )
+                return history
+
+    _saved_count = len(history)
 
     # Messages are already in the correct format for OpenAI
     return history
 
 
-def clear_conversation_history(filename="assistant/data/conversation_history.json"):
+def clear_conversation_history(filename=HISTORY_FILE):
     """Delete the conversation history file.
 
     Args:
-        filename: Path to the JSON file containing conversation history.
+        filename: Path to the JSONL file containing conversation history.
 
     This is useful for starting fresh conversations or clearing sensitive data.
     """
-    if os.path.exists(filename):
-        os.remove(filename)
-        print_success("Conversation history cleared.")
+    global _saved_count
+    _saved_count = 0
+
+    removed = False
+    for path in (filename, _LEGACY_HISTORY_FILE):
+        if os.path.exists(path):
+            os.remove(path)
+            removed = True
+
+    if removed:
+        ui.print_success("Conversation history cleared.")
     else:
-        print_warning("No conversation history to clear.")
+        ui.print_warning("No conversation history to clear.")
 
 
-def chat_mode(is_verbose=False):
+def chat_mode(is_verbose=False, use_cache=True):
     """Run the assistant in interactive chat mode.
 
     Args:
         is_verbose: If True, print detailed function call information.
+        use_cache: If True, serve repeated requests from the response cache.
 
     This mode allows continuous conversation with the AI without
     restarting the command. Type 'exit', 'quit', or press Ctrl+C to end.
     """
+    from rich import box
+    from rich.align import Align
+    from rich.panel import Panel
+    from rich.text import Text
+
+    client = _get_client()
     old_messages = get_saved_conversation()
 
     if not old_messages:
@@ -209,9 +535,9 @@ def chat_mode(is_verbose=False):
         messages = old_messages
 
     # Use matrix container for the entire chat session
-    with matrix_container():
+    with ui.matrix_container():
         # Show banner
-        print_banner()
+        ui.print_banner()
 
         # Add chat mode instructions
         chat_instructions = Panel(
@@ -227,16 +553,19 @@ def chat_mode(is_verbose=False):
             padding=(0, 2),
         )
 
-        from assistant.ui.config import _matrix_center_content
-        from assistant.ui.layout import _update_matrix_display
+        from assistant.ui.config import _matrix_center_content, mark_dirty
 
         _matrix_center_content.append(chat_instructions)
-        _update_matrix_display()
+        mark_dirty()
 
-        try:
+        # The whole session runs in one event loop: the client's pooled
+        # keep-alive connections are bound to the loop that created them,
+        # so a fresh asyncio.run per turn would hand turn two a dead
+        # connection ("Event loop is closed") from turn one's loop.
+        async def run_session():
             while True:
                 # Get user input inside the matrix
-                user_prompt = get_user_input_in_matrix("You")
+                user_prompt = ui.get_user_input_in_matrix("You")
 
                 # Check for exit commands
                 if user_prompt.lower().strip() in ["exit", "quit", "q", ""]:
@@ -247,7 +576,7 @@ def chat_mode(is_verbose=False):
                         padding=(0, 2),
                     )
                     _matrix_center_content.append(goodbye_panel)
-                    _update_matrix_display()
+                    mark_dirty()
                     time.sleep(1.5)
                     break
 
@@ -257,13 +586,10 @@ def chat_mode(is_verbose=False):
 
                 messages.append({"role": "user", "content": user_prompt})
 
-                for _ in range(20):
-                    final_text = generate_response(client, messages, is_verbose)
-                    if final_text:
-                        print_response(final_text)
-                        break
+                await _agent_loop(client, messages, is_verbose, use_cache)
 
-                save_conversation(messages)
+        try:
+            asyncio.run(run_session())
 
         except KeyboardInterrupt:
             goodbye_panel = Panel(
@@ -273,7 +599,7 @@ def chat_mode(is_verbose=False):
                 padding=(0, 2),
             )
             _matrix_center_content.append(goodbye_panel)
-            _update_matrix_display()
+            mark_dirty()
             time.sleep(1.5)
 
 
@@ -292,11 +618,12 @@ def main():
     multiple tool calls and process their results before generating
     a final response.
     """
-    args = parser.parse_args()
+    args = get_parser().parse_args()
     user_prompt = " ".join(args.prompt)
     is_verbose = args.verbose
     is_clear_history = args.clear
     is_chat_mode = args.chat
+    use_cache = not args.no_cache
 
     if is_clear_history:
         clear_conversation_history()
@@ -304,17 +631,48 @@ def main():
 
     # Enter interactive chat mode
     if is_chat_mode:
-        chat_mode(is_verbose)
+        chat_mode(is_verbose, use_cache)
+        sys.exit(0)
+
+    # Batch mode: one prompt per line, run as independent conversations.
+    if args.batch:
+        with open(args.batch, "r", encoding="utf-8") as f:
+            prompts = [line.strip() for line in f if line.strip()]
+
+        if not prompts:
+            ui.print_warning("Batch file contains no prompts.")
+            sys.exit(0)
+
+        client = _get_client()
+        results = asyncio.run(
+            _run_batch(
+                client,
+                prompts,
+                max(1, args.concurrency),
+                is_verbose,
+                use_cache,
+                args.semantic_cache,
+            )
+        )
+
+        for prompt, final_text in zip(prompts, results):
+            ui.console.print(f"[bold cyan]> {prompt}[/bold cyan]")
+            if final_text:
+                ui.print_response(final_text)
+            else:
+                ui.print_error("No final response within the iteration limit.")
         sys.exit(0)
 
     if not user_prompt:
-        print_error("Please provide input text as a command-line argument.")
+        ui.print_error("Please provide input text as a command-line argument.")
         sys.exit(1)
 
+    client = _get_client()
+
     # Use matrix container for all UI
-    with matrix_container():
+    with ui.matrix_container():
         # Show beautiful banner
-        print_banner()
+        ui.print_banner()
 
         old_messages = get_saved_conversation()
 
@@ -323,15 +681,23 @@ def main():
         else:
             messages = old_messages
 
+        # Fresh conversations may be answerable from a previous, similar
+        # prompt without any LLM round trip.
+        if args.semantic_cache and not old_messages:
+            cached_text = semantic_cache.lookup(user_prompt)
+            if cached_text is not None:
+                ui.print_response(cached_text)
+                return
+
         messages.append({"role": "user", "content": user_prompt})
 
-        for _ in range(20):
-            final_text = generate_response(client, messages, is_verbose)
-            if final_text:
-                print_response(final_text)
-                break
+        final_text = asyncio.run(_agent_loop(client, messages, is_verbose, use_cache))
 
-        save_conversation(messages)
+        # Only fresh conversations are stored, mirroring the lookup
+        # guard: an answer produced mid-conversation depends on that
+        # history and must not be replayed for the prompt alone.
+        if args.semantic_cache and final_text and not old_messages:
+            semantic_cache.store(user_prompt, final_text)
 
 
 if __name__ == "__main__":
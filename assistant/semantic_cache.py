@@ -0,0 +1,73 @@
+"""Similarity cache for near-duplicate user prompts.
+
+Many prompts are close paraphrases of earlier ones ("list files",
+"show me the files") that would otherwise trigger a full LLM round
+trip. Final answers are stored alongside their normalized prompts, and
+a sufficiently similar new prompt is served straight from the cache.
+
+Similarity is computed with difflib's SequenceMatcher on normalized
+prompt text, which keeps the feature dependency-free; an embedding
+model would catch more paraphrases but is far heavier than this CLI
+warrants. The cache is opt-in via the --semantic-cache flag and is only
+consulted for fresh conversations, since an answer produced under one
+history is not interchangeable with another.
+"""
+
+import difflib
+import json
+import os
+
+from assistant.llm_cache import user_cache_dir
+
+CACHE_PATH = os.path.join(user_cache_dir(), "semantic_cache.json")
+
+# Minimum SequenceMatcher ratio for a cached answer to be reused.
+SIMILARITY_THRESHOLD = 0.92
+
+
+def _normalize(prompt):
+    return " ".join(prompt.lower().split())
+
+
+def _load_entries():
+    try:
+        with open(CACHE_PATH, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return []
+
+
+def lookup(prompt):
+    """Return the cached response most similar to prompt, or None.
+
+    Only matches at or above SIMILARITY_THRESHOLD qualify; among those,
+    the closest prompt wins.
+    """
+    target = _normalize(prompt)
+    best_response = None
+    best_score = SIMILARITY_THRESHOLD
+
+    for entry in _load_entries():
+        score = difflib.SequenceMatcher(None, target, entry["prompt"]).ratio()
+        if score >= best_score:
+            best_response = entry["response"]
+            best_score = score
+
+    return best_response
+
+
+def store(prompt, response):
+    """Remember the final response produced for a prompt."""
+    entries = _load_entries()
+    normalized = _normalize(prompt)
+
+    for entry in entries:
+        if entry["prompt"] == normalized:
+            entry["response"] = response
+            break
+    else:
+        entries.append({"prompt": normalized, "response": response})
+
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    with open(CACHE_PATH, "w") as f:
+        json.dump(entries, f, indent=2)
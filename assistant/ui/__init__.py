@@ -5,49 +5,51 @@ This package provides a unified terminal UI with:
 - Rich-formatted panels for messages
 - Live display for smooth updates
 - Markdown rendering for AI responses
+
+Submodules are imported lazily on first attribute access (PEP 562), so
+merely importing ``assistant.ui`` does not pull in Rich. Command paths
+that never render anything (e.g. ``--help``) skip that cost entirely.
 """
 
-from .display import (
-    print_banner,
-    print_response,
-    print_error,
-    print_success,
-    print_warning,
-    print_verbose_response,
-)
-from .input import get_user_input_in_matrix
-from .containers import matrix_container, processing_panel, function_calls_panel
-from .legacy import (
-    print_function_call,
-    print_function_complete,
-    print_code_block,
-    print_request_info,
-    print_divider,
-    print_step,
-)
-from .config import console
-
-__all__ = [
+# Maps each public name to the submodule that defines it.
+_SUBMODULE_BY_NAME = {
     # Display functions
-    "print_banner",
-    "print_response",
-    "print_error",
-    "print_success",
-    "print_warning",
-    "print_verbose_response",
+    "print_banner": "display",
+    "print_response": "display",
+    "print_error": "display",
+    "print_success": "display",
+    "print_warning": "display",
+    "print_verbose_response": "display",
     # Input functions
-    "get_user_input_in_matrix",
+    "get_user_input_in_matrix": "input",
     # Context managers
-    "matrix_container",
-    "processing_panel",
-    "function_calls_panel",
+    "matrix_container": "containers",
+    "processing_panel": "containers",
+    "streaming_panel": "containers",
+    "function_calls_panel": "containers",
     # Legacy functions
-    "print_function_call",
-    "print_function_complete",
-    "print_code_block",
-    "print_request_info",
-    "print_divider",
-    "print_step",
+    "print_function_call": "legacy",
+    "print_function_complete": "legacy",
+    "print_code_block": "legacy",
+    "print_request_info": "legacy",
+    "print_divider": "legacy",
+    "print_step": "legacy",
     # Console instance
-    "console",
-]
+    "console": "config",
+}
+
+__all__ = list(_SUBMODULE_BY_NAME)
+
+
+def __getattr__(name):
+    """Resolve a public name by importing its submodule on demand."""
+    submodule_name = _SUBMODULE_BY_NAME.get(name)
+    if submodule_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(f".{submodule_name}", __name__), name)
+    # Cache on the package so __getattr__ only runs once per name.
+    globals()[name] = value
+    return value
@@ -1,5 +1,8 @@
 """Configuration constants and global state for the UI package."""
 
+import collections
+import threading
+
 from rich.console import Console
 
 # =============================================================================
@@ -9,6 +12,9 @@ from rich.console import Console
 MATRIX_PANEL_WIDTH = 22
 MAX_VISIBLE_MESSAGES = 10
 
+# Target frame interval for the display render loop (~12 FPS).
+MATRIX_ANIMATION_DELAY = 0.08
+
 COLOR_PRIMARY = "magenta"
 COLOR_SECONDARY = "cyan"
 COLOR_SUCCESS = "green"
@@ -22,5 +28,61 @@ COLOR_MATRIX = "green"
 
 console = Console()
 
+# Cached once: is_terminal re-checks stdout on every access, and the
+# answer cannot change mid-process. Piped/CI output skips the Live
+# display and animation threads entirely.
+IS_TERMINAL = console.is_terminal
+
 _matrix_live = None
-_matrix_center_content = []
+
+# Bounded to what is actually visible: older panels fall off the left as
+# new ones arrive, so per-frame render cost stays O(MAX_VISIBLE_MESSAGES)
+# instead of growing with the whole session.
+_matrix_center_content = collections.deque(maxlen=MAX_VISIBLE_MESSAGES)
+
+# Tool calls run on worker threads and append panels while the render
+# thread reads the deque; iterating a deque during a concurrent append
+# raises "deque mutated during iteration". All composite mutations and
+# the render thread's snapshot take this lock.
+_matrix_lock = threading.Lock()
+
+# Producer/consumer handoff for display updates: mutators set the event,
+# and the render thread in matrix_container rebuilds the layout at most
+# once per frame no matter how many panels were appended in between.
+_matrix_dirty = threading.Event()
+
+# Monotonic content-mutation counter, folded into the frame fingerprint.
+# (len, id(last)) alone misses in-place replacement of an earlier panel
+# — streaming updates stopped repainting once any panel landed after
+# them — whereas every mutation bumps this.
+_matrix_version = 0
+
+
+def mark_dirty():
+    """Record a content mutation and wake the render worker."""
+    global _matrix_version
+    _matrix_version += 1
+    _matrix_dirty.set()
+
+
+def _flush_batch(*renderables, pad=False):
+    """Print renderables in one buffered write to the terminal.
+
+    Each console.print on an unbuffered TTY is its own write() syscall,
+    so helpers that print spacing + panel + spacing hit the kernel three
+    times and the frame can land torn. Capturing the rendered output and
+    writing it once delivers the whole block atomically.
+
+    Args:
+        renderables: Rich renderables to print in order
+        pad: Surround the block with blank lines
+    """
+    with console.capture() as capture:
+        if pad:
+            console.print()
+        for renderable in renderables:
+            console.print(renderable)
+        if pad:
+            console.print()
+    console.file.write(capture.get())
+    console.file.flush()
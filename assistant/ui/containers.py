@@ -1,6 +1,7 @@
 """Context managers for display management."""
 
 from contextlib import contextmanager
+import os
 import time
 import threading
 
@@ -14,14 +15,96 @@ from rich import box
 
 from .config import (
     console,
+    _flush_batch,
     _matrix_live,
     _matrix_center_content,
+    MATRIX_ANIMATION_DELAY,
     COLOR_PRIMARY,
     COLOR_SECONDARY,
 )
 from .layout import _update_matrix_display
 
 
+# Single long-lived render worker for the whole session. matrix_container
+# only toggles the run/stop events; the thread parks on _render_run
+# between containers instead of being created and joined once per
+# container (chat mode used to respawn it every turn).
+_render_run = threading.Event()
+_render_stop = threading.Event()
+_render_drained = threading.Event()
+_render_thread = None
+
+
+def _render_loop():
+    """Consume dirty events and rebuild the layout at most once per frame.
+
+    Mutators only set the dirty event, so N rapid panel appends cost one
+    render, not N. Renders are paced to the frame budget; if a rebuild
+    blows the budget the terminal can't keep up, so the loop backs off
+    (at least double, capped at 1s) and drops frames rather than queueing
+    renders the display will never catch up on.
+    """
+    import assistant.ui.config as config
+
+    while True:
+        _render_run.wait()
+        config._matrix_dirty.wait(timeout=MATRIX_ANIMATION_DELAY)
+
+        if config._matrix_dirty.is_set():
+            config._matrix_dirty.clear()
+
+            start = time.perf_counter()
+            try:
+                _update_matrix_display()
+            except Exception:
+                # A failed frame must not kill the worker — nothing
+                # restarts it mid-session, and the next dirty event will
+                # try again with fresh content.
+                pass
+            elapsed = time.perf_counter() - start
+
+            if elapsed > MATRIX_ANIMATION_DELAY:
+                pause = min(max(elapsed, 2 * MATRIX_ANIMATION_DELAY), 1.0)
+            else:
+                pause = MATRIX_ANIMATION_DELAY - elapsed
+            _render_stop.wait(pause)
+
+        if _render_stop.is_set() and not config._matrix_dirty.is_set():
+            # Last pending frame has been flushed; park until the next
+            # container starts.
+            _render_drained.set()
+            _render_run.clear()
+            _render_stop.clear()
+
+
+def _ensure_render_thread():
+    """Start the render worker on first use; reuse it afterwards."""
+    global _render_thread
+    if _render_thread is None or not _render_thread.is_alive():
+        _render_thread = threading.Thread(target=_render_loop, daemon=True)
+        _render_thread.start()
+
+
+class _SynchronizedLive(Live):
+    """Live display that brackets each repaint in DEC 2026 markers.
+
+    Terminals that support synchronized output (Ghostty, Kitty, iTerm2,
+    recent WezTerm) hold the frame until the end marker and paint it
+    atomically, eliminating tearing on partial writes; terminals that
+    don't simply ignore the sequences. Overriding refresh() covers every
+    repaint, including the ones Live's auto-refresh timer issues.
+    """
+
+    def refresh(self):
+        file = self.console.file
+        try:
+            file.write("\x1b[?2026h")
+            super().refresh()
+        finally:
+            file.write("\x1b[?2026l")
+            file.flush()
+
+
 @contextmanager
 def matrix_container():
     """Context manager for cyberpunk-styled display.
@@ -35,20 +118,39 @@ def matrix_container():
     """
     import assistant.ui.config as config
 
-    config._matrix_center_content.clear()
-    console.print()
+    if not config.IS_TERMINAL or os.environ.get("NO_MATRIX"):
+        # Piped/CI output (or explicit NO_MATRIX opt-out): skip the Live
+        # display entirely; panels fall back to plain sequential prints
+        # via _add_to_matrix_or_print.
+        yield
+        return
 
-    config._matrix_live = Live(console=console, refresh_per_second=4, auto_refresh=True)
+    with config._matrix_lock:
+        config._matrix_center_content.clear()
+
+    # screen=True runs the session on the terminal's alternate screen:
+    # no scrollback pollution from repainted frames, cursor hidden, and
+    # the user's shell history is restored intact on exit.
+    config._matrix_live = _SynchronizedLive(
+        console=console, screen=True, refresh_per_second=4, auto_refresh=True
+    )
     config._matrix_live.start()
-    _update_matrix_display()
+
+    _ensure_render_thread()
+    _render_drained.clear()
+    _render_stop.clear()
+    config.mark_dirty()
+    _render_run.set()
 
     try:
         yield
     finally:
-        time.sleep(1.5)
+        # Wait for the worker to drain its final frame instead of a fixed
+        # tail sleep; the last frame stays on screen after stop.
+        _render_stop.set()
+        _render_drained.wait(timeout=0.2)
         config._matrix_live.stop()
         config._matrix_live = None
-        console.print()
 
 
 def _add_to_matrix_or_print(panel):
@@ -60,12 +162,11 @@ def _add_to_matrix_or_print(panel):
     import assistant.ui.config as config
 
     if config._matrix_live is not None:
-        config._matrix_center_content.append(panel)
-        _update_matrix_display()
+        with config._matrix_lock:
+            config._matrix_center_content.append(panel)
+        config.mark_dirty()
     else:
-        console.print()
-        console.print(panel)
-        console.print()
+        _flush_batch(panel, pad=True)
 
 
 @contextmanager
@@ -76,7 +177,11 @@ def processing_panel(message="AI is thinking"):
         message: Status message to display
     """
     import assistant.ui.config as config
-    import threading
+
+    if not config.IS_TERMINAL:
+        # No spinner, no animation thread when nobody is watching.
+        yield
+        return
 
     spinner_text = Text()
     spinner_text.append(message, style=f"bold {COLOR_SECONDARY}")
@@ -92,27 +197,22 @@ def processing_panel(message="AI is thinking"):
     )
 
     if config._matrix_live is not None:
-        config._matrix_center_content.append(panel)
-
-        # Start animation thread to keep spinner moving
-        stop_event = threading.Event()
-
-        def animate_spinner():
-            while not stop_event.is_set():
-                _update_matrix_display()
-                time.sleep(0.08)  # ~12 FPS for smooth animation
-
-        animation_thread = threading.Thread(target=animate_spinner, daemon=True)
-        animation_thread.start()
+        # No per-panel animation thread: the session's render worker
+        # pushes the frame containing the Spinner once, and Live's
+        # auto_refresh re-renders it each refresh tick, which is what
+        # advances the spinner frames. Spawning (and joining) a thread
+        # per panel only duplicated that work.
+        with config._matrix_lock:
+            config._matrix_center_content.append(panel)
+        config.mark_dirty()
 
         try:
             yield
         finally:
-            stop_event.set()
-            animation_thread.join(timeout=0.5)
-            if panel in config._matrix_center_content:
-                config._matrix_center_content.remove(panel)
-            _update_matrix_display()
+            with config._matrix_lock:
+                if panel in config._matrix_center_content:
+                    config._matrix_center_content.remove(panel)
+            config.mark_dirty()
     else:
         console.print()
         with Live(panel, console=console, refresh_per_second=10):
@@ -120,6 +220,107 @@ def processing_panel(message="AI is thinking"):
         console.print()
 
 
+@contextmanager
+def streaming_panel(message="AI is thinking"):
+    """Display a panel that fills with response text as it streams in.
+
+    Starts out as a spinner (identical to processing_panel) and switches
+    to rendering the accumulated response once the first tokens arrive.
+
+    Args:
+        message: Status message shown before the first token.
+
+    Yields:
+        Callable accepting the accumulated response text so far; each
+        call redraws the panel with that snapshot. Redraws are throttled
+        to ~10 per second so token-rate updates stay cheap.
+    """
+    import assistant.ui.config as config
+
+    if not config.IS_TERMINAL:
+        # Streaming redraws are pointless when piped; the final response
+        # is printed on its own once complete.
+        yield lambda snapshot: None
+        return
+
+    from rich.markdown import Markdown
+
+    spinner_text = Text()
+    spinner_text.append(message, style=f"bold {COLOR_SECONDARY}")
+    spinner_text.append("...", style=COLOR_SECONDARY)
+    spinner_text.justify = "center"
+
+    def _make_panel(body):
+        return Panel(
+            body,
+            title=f"[bold {COLOR_SECONDARY}]Processing Request[/bold {COLOR_SECONDARY}]",
+            border_style=COLOR_PRIMARY,
+            box=box.ROUNDED,
+            padding=(0, 1),
+        )
+
+    placeholder = Align.center(Spinner("aesthetic", text=spinner_text, style=COLOR_PRIMARY))
+
+    if config._matrix_live is not None:
+        # The panel is tracked by object identity, not position:
+        # pipelined tool calls append (and evict) panels concurrently,
+        # so a positional index can drift onto a different panel
+        # mid-stream.
+        current = _make_panel(placeholder)
+        with config._matrix_lock:
+            config._matrix_center_content.append(current)
+        config.mark_dirty()
+        last_drawn = 0.0
+
+        def update(snapshot):
+            nonlocal current, last_drawn
+            now = time.monotonic()
+            if now - last_drawn < 0.1:
+                return
+            last_drawn = now
+            refreshed = _make_panel(Markdown(snapshot))
+            with config._matrix_lock:
+                try:
+                    index = config._matrix_center_content.index(current)
+                except ValueError:
+                    # Evicted from the bounded deque by newer panels;
+                    # nothing left on screen to repaint.
+                    current = refreshed
+                    return
+                config._matrix_center_content[index] = refreshed
+            current = refreshed
+            config.mark_dirty()
+
+        try:
+            yield update
+        finally:
+            # The final response is printed separately; drop the
+            # in-progress panel like processing_panel does.
+            with config._matrix_lock:
+                try:
+                    config._matrix_center_content.remove(current)
+                except ValueError:
+                    pass
+            config.mark_dirty()
+    else:
+        console.print()
+        with Live(
+            _make_panel(placeholder), console=console, refresh_per_second=10
+        ) as live:
+            last_drawn = 0.0
+
+            def update(snapshot):
+                nonlocal last_drawn
+                now = time.monotonic()
+                if now - last_drawn < 0.1:
+                    return
+                last_drawn = now
+                live.update(_make_panel(Markdown(snapshot)))
+
+            yield update
+        console.print()
+
+
 @contextmanager
 def function_calls_panel():
     """Display function call execution panel.
@@ -143,8 +344,8 @@ def function_calls_panel():
         )
 
         if config._matrix_live is not None:
-            config._matrix_center_content.append(panel)
-            _update_matrix_display()
+            with config._matrix_lock:
+                config._matrix_center_content.append(panel)
+            config.mark_dirty()
         else:
-            console.print()
-            console.print(panel)
+            _flush_batch(panel, pad=True)
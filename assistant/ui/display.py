@@ -16,9 +16,13 @@ from .config import (
 )
 from .containers import _add_to_matrix_or_print
 
+# Substrings that indicate a response actually uses markdown. Short
+# plain-text answers skip the full CommonMark parse.
+_MARKDOWN_MARKERS = ("```", "\n#", "# ", "\n*", "\n-", "](", "**", "`")
 
-def print_banner():
-    """Display startup banner."""
+
+def _build_banner_panel():
+    """Assemble the static startup banner panel."""
     banner_text = Text()
     banner_text.append("   _____ _      _____ \n", style=f"bold {COLOR_SECONDARY}")
     banner_text.append("  / ____| |    |_   _|\n", style=f"bold {COLOR_SECONDARY}")
@@ -29,7 +33,7 @@ def print_banner():
     banner_text.append("\n   AI Assistant\n", style=f"bold {COLOR_SECONDARY}")
     banner_text.append("   Powered by Qwen3-8b", style=f"dim {COLOR_SECONDARY}")
 
-    panel = Panel(
+    return Panel(
         banner_text,
         title="[bold magenta]Welcome[/bold magenta]",
         title_align="left",
@@ -37,7 +41,15 @@ def print_banner():
         box=box.ROUNDED,
         padding=(0, 1),
     )
-    _add_to_matrix_or_print(panel)
+
+
+# The banner is a static asset; build its Text spans and Panel once.
+_BANNER_PANEL = _build_banner_panel()
+
+
+def print_banner():
+    """Display startup banner."""
+    _add_to_matrix_or_print(_BANNER_PANEL)
 
 
 def print_response(text):
@@ -45,9 +57,17 @@ def print_response(text):
 
     Args:
         text: Response text (markdown supported)
+
+    Responses without any markdown markers are rendered as plain text,
+    skipping the CommonMark parse; the output is visually identical.
     """
+    if any(marker in text for marker in _MARKDOWN_MARKERS):
+        body = Markdown(text)
+    else:
+        body = Text(text)
+
     panel = Panel(
-        Markdown(text),
+        body,
         title="[bold cyan]AI Response[/bold cyan]",
         title_align="left",
         border_style=COLOR_PRIMARY,
@@ -57,15 +77,24 @@ def print_response(text):
     _add_to_matrix_or_print(panel)
 
 
+# Status prefixes as prebuilt Text templates: interpolating the message
+# into Rich markup makes every call re-run the markup tokenizer over the
+# whole string. Copying a template and appending the message with an
+# explicit style skips the parser entirely.
+_ERROR_PREFIX = Text.assemble(("X ", f"bold {COLOR_ERROR}"))
+_SUCCESS_PREFIX = Text.assemble(("+ ", f"bold {COLOR_SUCCESS}"))
+_WARNING_PREFIX = Text.assemble(("! ", f"bold {COLOR_WARNING}"))
+
+
 def print_error(message):
     """Display error message.
 
     Args:
         message: Error message text
     """
-    console.print(
-        f"[bold {COLOR_ERROR}]X[/bold {COLOR_ERROR}] [{COLOR_ERROR}]{message}[/{COLOR_ERROR}]"
-    )
+    text = _ERROR_PREFIX.copy()
+    text.append(message, style=COLOR_ERROR)
+    console.print(text)
 
 
 def print_success(message):
@@ -74,9 +103,9 @@ def print_success(message):
     Args:
         message: Success message text
     """
-    console.print(
-        f"[bold {COLOR_SUCCESS}]+[/bold {COLOR_SUCCESS}] [{COLOR_SUCCESS}]{message}[/{COLOR_SUCCESS}]"
-    )
+    text = _SUCCESS_PREFIX.copy()
+    text.append(message, style=COLOR_SUCCESS)
+    console.print(text)
 
 
 def print_warning(message):
@@ -85,9 +114,9 @@ def print_warning(message):
     Args:
         message: Warning message text
     """
-    console.print(
-        f"[bold {COLOR_WARNING}]![/bold {COLOR_WARNING}] [{COLOR_WARNING}]{message}[/{COLOR_WARNING}]"
-    )
+    text = _WARNING_PREFIX.copy()
+    text.append(message, style=COLOR_WARNING)
+    console.print(text)
 
 
 def print_verbose_response(response_data):
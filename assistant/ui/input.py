@@ -1,5 +1,8 @@
 """User input handling."""
 
+from functools import lru_cache
+
+from rich.control import Control
 from rich.panel import Panel
 from rich.text import Text
 from rich import box
@@ -10,10 +13,26 @@ from .layout import (
     _create_side_panel,
     _create_center_panel,
     _create_layout,
-    _update_matrix_display,
 )
 
 
+@lru_cache(maxsize=8)
+def _input_prompt_panel(prompt_text):
+    """Build (once per label) the static input prompt panel.
+
+    The panel is identical on every prompt of a session, so rebuilding
+    its Text, border, and style objects each turn is pure waste.
+    """
+    return Panel(
+        Text("Type your message below:", style=f"{COLOR_SECONDARY}"),
+        title=f"[bold {COLOR_PRIMARY}]{prompt_text}[/bold {COLOR_PRIMARY}]",
+        title_align="left",
+        border_style=COLOR_PRIMARY,
+        box=box.ROUNDED,
+        padding=(0, 1),
+    )
+
+
 def get_user_input_in_matrix(prompt_text="You"):
     """Get user input with clean display pause/resume.
 
@@ -29,27 +48,32 @@ def get_user_input_in_matrix(prompt_text="You"):
         config._matrix_live.stop()
 
         height = _get_terminal_height()
-        input_prompt_panel = Panel(
-            Text("Type your message below:", style=f"{COLOR_SECONDARY}"),
-            title=f"[bold {COLOR_PRIMARY}]{prompt_text}[/bold {COLOR_PRIMARY}]",
-            title_align="left",
-            border_style=COLOR_PRIMARY,
-            box=box.ROUNDED,
-            padding=(0, 1),
-        )
+        input_prompt_panel = _input_prompt_panel(prompt_text)
 
-        temp_content = config._matrix_center_content.copy()
-        temp_content.append(input_prompt_panel)
+        # Show the prompt panel by appending it in place and popping it
+        # after the frame is printed, instead of copying the whole
+        # content deque per prompt. Appending to a full bounded deque
+        # evicts the oldest panel, so stash and restore it.
+        content = config._matrix_center_content
+        with config._matrix_lock:
+            evicted = content[0] if len(content) == content.maxlen else None
+            content.append(input_prompt_panel)
 
         # Create static layout
         left_panel = _create_side_panel(height)
-        center_panel = _create_center_panel(temp_content)
+        center_panel = _create_center_panel(content)
         right_panel = _create_side_panel(height)
 
         layout = _create_layout(left_panel, center_panel, right_panel)
 
-        # Display the layout with input prompt
-        console.clear()
+        # The Live session runs on the alternate screen; stopping it
+        # dropped back to the main screen, so re-enter the alt screen
+        # for the input frame rather than printing the layout into the
+        # user's scrollback. Homing the cursor and overwriting the
+        # previous frame touches the same cells without the full-screen
+        # ANSI clear, so the transition doesn't flash on slow terminals.
+        console.set_alt_screen(True)
+        console.control(Control.home())
         console.print(layout)
         console.print()
 
@@ -60,6 +84,11 @@ def get_user_input_in_matrix(prompt_text="You"):
             )
         except (EOFError, KeyboardInterrupt):
             user_input = ""
+        finally:
+            with config._matrix_lock:
+                content.pop()
+                if evicted is not None:
+                    content.appendleft(evicted)
 
         # Add message to content
         if user_input.strip():
@@ -74,7 +103,7 @@ def get_user_input_in_matrix(prompt_text="You"):
             config._matrix_center_content.append(message_panel)
 
         config._matrix_live.start()
-        _update_matrix_display()
+        config.mark_dirty()
     else:
         user_input = console.input(
             f"[bold {COLOR_PRIMARY}]You >[/bold {COLOR_PRIMARY}] "
@@ -1,5 +1,8 @@
 """Border and layout generation utilities."""
 
+import signal
+import time
+
 from rich.panel import Panel
 from rich.text import Text
 from rich.layout import Layout
@@ -8,13 +11,37 @@ from rich import box
 
 from .config import (
     MATRIX_PANEL_WIDTH,
-    MAX_VISIBLE_MESSAGES,
     COLOR_PRIMARY,
     COLOR_MATRIX,
     console,
 )
 
 
+# Pattern cycle and gradient styles are fixed, and the panel width is a
+# constant — so the four possible border lines can be expanded once at
+# import instead of re-deriving patterns, styles, and string
+# multiplications for every row of every call.
+_WIDTH = MATRIX_PANEL_WIDTH - 2
+_LINES = (
+    "=" * _WIDTH,
+    "-" * _WIDTH,
+    "#" * _WIDTH,
+    ("=#-" * (_WIDTH // 3 + 1))[:_WIDTH],
+)
+_STYLE_BRIGHT = f"bold {COLOR_MATRIX}"
+_STYLE_MID = COLOR_MATRIX
+_STYLE_DIM = f"dim {COLOR_MATRIX}"
+
+
+# The border is deterministic per height, so the frame path can reuse
+# one rendered Text (and the input path one Panel) instead of rebuilding
+# them every update. The Text is only ever read during render, never
+# mutated, which makes sharing safe. Heights come from the terminal size,
+# so a handful of entries covers a session including resizes.
+_border_cache = {}
+_side_panel_cache = {}
+
+
 def _create_cyberpunk_border(height):
     """Create static ASCII cyberpunk border pattern.
 
@@ -22,39 +49,65 @@ def _create_cyberpunk_border(height):
         height: Number of lines to generate
 
     Returns:
-        Rich Text object with ASCII patterns
+        Rich Text object with ASCII patterns (cached per height)
     """
-    text = Text()
-    width = MATRIX_PANEL_WIDTH - 2
+    cached = _border_cache.get(height)
+    if cached is not None:
+        return cached
+
+    lines = [_LINES[i % 4] for i in range(height)]
+
+    # Gradient effect: bold → normal → dim. Text.assemble builds the
+    # span list in one pass from the three style buckets instead of
+    # growing it append by append.
+    first = height // 3
+    second = 2 * height // 3
+
+    text = Text.assemble(
+        *(
+            ("\n".join(chunk) + "\n", style)
+            for chunk, style in (
+                (lines[:first], _STYLE_BRIGHT),
+                (lines[first:second], _STYLE_MID),
+                (lines[second:], _STYLE_DIM),
+            )
+            if chunk
+        )
+    )
+    _border_cache[height] = text
+    return text
 
-    ascii_patterns = ["=", "-", "#", "=#-"]
 
-    for i in range(height):
-        pattern = ascii_patterns[i % 4]
-        if pattern == "=#-":
-            line = (pattern * (width // 3 + 1))[:width]
-        else:
-            line = pattern * width
+# console.size probes the terminal (an ioctl) on every access, and
+# _get_terminal_height runs once per animation frame. Cache the answer
+# for half a second; SIGWINCH zeroes the timestamp so resizes still take
+# effect immediately where the platform delivers it.
+_HEIGHT_TTL = 0.5
+_height_cache = [0, 0.0]  # [height, taken_at]
 
-        # Gradient effect: bold → normal → dim
-        if i < height // 3:
-            style = f"bold {COLOR_MATRIX}"
-        elif i < 2 * height // 3:
-            style = COLOR_MATRIX
-        else:
-            style = f"dim {COLOR_MATRIX}"
 
-        text.append(line + "\n", style=style)
+def _get_terminal_height():
+    """Get current terminal height with fallback (cached for ~500ms)."""
+    now = time.monotonic()
+    if _height_cache[0] and now - _height_cache[1] < _HEIGHT_TTL:
+        return _height_cache[0]
 
-    return text
+    try:
+        height = max(console.size.height - 4, 20)
+    except (AttributeError, OSError):
+        height = 30
 
+    _height_cache[0] = height
+    _height_cache[1] = now
+    return height
 
-def _get_terminal_height():
-    """Get current terminal height with fallback."""
+
+if hasattr(signal, "SIGWINCH"):
     try:
-        return max(console.size.height - 4, 20)
-    except Exception:
-        return 30
+        signal.signal(signal.SIGWINCH, lambda *_: _height_cache.__setitem__(1, 0.0))
+    except ValueError:
+        # Imported outside the main thread; the TTL alone covers resizes.
+        pass
 
 
 def _create_side_panel(height):
@@ -64,43 +117,52 @@ def _create_side_panel(height):
         height: Panel height in lines
 
     Returns:
-        Rich Panel with ASCII border pattern
+        Rich Panel with ASCII border pattern (cached per height)
     """
-    return Panel(
-        _create_cyberpunk_border(height),
-        border_style=f"dim {COLOR_MATRIX}",
-        box=box.ROUNDED,
-        padding=(0, 0),
-    )
+    panel = _side_panel_cache.get(height)
+    if panel is None:
+        panel = Panel(
+            _create_cyberpunk_border(height),
+            border_style=f"dim {COLOR_MATRIX}",
+            box=box.ROUNDED,
+            padding=(0, 0),
+        )
+        _side_panel_cache[height] = panel
+    return panel
 
 
-def _create_center_panel(content_list):
-    """Create center panel with message history.
+def _center_group(content_list):
+    """Group the visible messages with spacing.
 
     Args:
-        content_list: List of Rich renderable objects
+        content_list: Bounded deque (or list) of Rich renderables; the
+            deque's maxlen already caps it to MAX_VISIBLE_MESSAGES.
 
     Returns:
-        Rich Panel with formatted content
+        Rich renderable for the center panel body
     """
-    display_content = (
-        content_list[-MAX_VISIBLE_MESSAGES:]
-        if len(content_list) > MAX_VISIBLE_MESSAGES
-        else content_list
-    )
-
-    if display_content:
+    if content_list:
+        last = len(content_list) - 1
         spaced_content = []
-        for i, item in enumerate(display_content):
+        for i, item in enumerate(content_list):
             spaced_content.append(item)
-            if i < len(display_content) - 1:
+            if i < last:
                 spaced_content.append(Text(""))
-        content = Group(*spaced_content)
-    else:
-        content = Text("")
+        return Group(*spaced_content)
+    return Text("")
 
+
+def _create_center_panel(content_list):
+    """Create center panel with message history.
+
+    Args:
+        content_list: List of Rich renderable objects
+
+    Returns:
+        Rich Panel with formatted content
+    """
     return Panel(
-        content,
+        _center_group(content_list),
         border_style=f"bold {COLOR_PRIMARY}",
         box=box.HEAVY,
         padding=(0, 1),
@@ -127,17 +189,53 @@ def _create_layout(left_panel, center_panel, right_panel):
     return layout
 
 
+# Persistent render tree for the Live display. Every frame has the same
+# panel/layout structure, so the panels and layout are allocated once and
+# only their inner renderables are swapped per update.
+_live_left = Panel(
+    Text(""), border_style=f"dim {COLOR_MATRIX}", box=box.ROUNDED, padding=(0, 0)
+)
+_live_right = Panel(
+    Text(""), border_style=f"dim {COLOR_MATRIX}", box=box.ROUNDED, padding=(0, 0)
+)
+_live_center = Panel(
+    Text(""), border_style=f"bold {COLOR_PRIMARY}", box=box.HEAVY, padding=(0, 1)
+)
+_live_layout = _create_layout(_live_left, _live_center, _live_right)
+
+
+# Cheap fingerprint of the last rendered frame; identical frames (the
+# common case while the user reads or a spinner idles) skip the layout
+# rebuild entirely. The content-mutation counter covers in-place panel
+# replacement, which length/identity of the tail would miss. Live's
+# auto_refresh keeps any Spinner in the tree animating without new
+# updates from us.
+_last_render_key = None
+
+
 def _update_matrix_display():
     """Update Live display with current content."""
-    from .config import _matrix_live, _matrix_center_content
+    global _last_render_key
+
+    from . import config
 
-    if _matrix_live is None:
+    if config._matrix_live is None:
         return
 
     height = _get_terminal_height()
-    left_panel = _create_side_panel(height)
-    center_panel = _create_center_panel(_matrix_center_content)
-    right_panel = _create_side_panel(height)
+    # Snapshot under the lock: worker threads append panels while this
+    # thread renders, and iterating the live deque mid-append raises.
+    with config._matrix_lock:
+        content = list(config._matrix_center_content)
+        version = config._matrix_version
+    key = (id(config._matrix_live), version, height)
+    if key == _last_render_key:
+        return
+    _last_render_key = key
+
+    border = _create_cyberpunk_border(height)
+    _live_left.renderable = border
+    _live_right.renderable = border
+    _live_center.renderable = _center_group(content)
 
-    layout = _create_layout(left_panel, center_panel, right_panel)
-    _matrix_live.update(layout)
+    config._matrix_live.update(_live_layout)
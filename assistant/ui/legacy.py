@@ -7,6 +7,7 @@ from rich import box
 
 from .config import (
     console,
+    _flush_batch,
     COLOR_PRIMARY,
     COLOR_SECONDARY,
     COLOR_SUCCESS,
@@ -33,7 +34,11 @@ def print_function_complete(function_name):
         function_name: Name of completed function
     """
     console.print(
-        f"[bold {COLOR_SUCCESS}]+[/bold {COLOR_SUCCESS}] [{COLOR_SECONDARY}]{function_name}[/{COLOR_SECONDARY}] [{COLOR_SUCCESS}]completed[/{COLOR_SUCCESS}]"
+        Text.assemble(
+            ("+ ", f"bold {COLOR_SUCCESS}"),
+            (function_name, COLOR_SECONDARY),
+            (" completed", COLOR_SUCCESS),
+        )
     )
 
 
@@ -86,12 +91,10 @@ def print_request_info(user_prompt, response=None):
             table.add_row("Prompt Tokens", str(metadata.prompt_token_count))
             table.add_row("Response Tokens", str(metadata.candidates_token_count))
             table.add_row("Total Tokens", str(metadata.total_token_count))
-        except Exception:
+        except AttributeError:
             pass
 
-    console.print()
-    console.print(table)
-    console.print()
+    _flush_batch(table, pad=True)
 
 
 def print_divider(text=""):
@@ -101,16 +104,15 @@ def print_divider(text=""):
         text: Optional divider text
     """
     if text:
-        console.print()
-        console.print(
+        _flush_batch(
             Panel(
                 Text(text, style=f"bold {COLOR_SECONDARY}", justify="center"),
                 border_style=COLOR_PRIMARY,
                 box=box.ROUNDED,
                 padding=(0, 1),
-            )
+            ),
+            pad=True,
         )
-        console.print()
     else:
         console.print(
             f"[dim {COLOR_SECONDARY}]" + "─" * 60 + f"[/dim {COLOR_SECONDARY}]"
@@ -126,6 +128,10 @@ def print_step(step_num, total_steps, message):
         message: Step description
     """
     console.print(
-        f"[bold {COLOR_PRIMARY}][{step_num}[/bold {COLOR_PRIMARY}][dim]/{total_steps}[/dim][bold {COLOR_PRIMARY}]][/bold {COLOR_PRIMARY}] "
-        f"[{COLOR_SECONDARY}]{message}[/{COLOR_SECONDARY}]"
+        Text.assemble(
+            (f"[{step_num}", f"bold {COLOR_PRIMARY}"),
+            (f"/{total_steps}", "dim"),
+            ("] ", f"bold {COLOR_PRIMARY}"),
+            (message, COLOR_SECONDARY),
+        )
     )